@@ -1,16 +1,21 @@
 """
 Core profiling functionality
 """
-from typing import Optional, List, Literal, Dict, Any, Union
+from typing import Optional, List, Literal, Dict, Any, Union, Tuple
+from dataclasses import dataclass
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from plotly.offline import get_plotlyjs_version
 import numpy as np
+from scipy.stats import gaussian_kde
 from pathlib import Path
 from jinja2 import Environment, PackageLoader
 from xhtml2pdf import pisa
+from concurrent.futures import ThreadPoolExecutor
 import os
+import tempfile
 import builtins
 from .visualizations import _convert_to_static_image
 from io import StringIO
@@ -18,6 +23,22 @@ from io import StringIO
 # Initialize Jinja2 environment with PackageLoader
 env = Environment(loader=PackageLoader('pytics', 'templates'))
 env.globals['len'] = builtins.len
+# Plots are exported without their own loader, so the report loads the
+# plotly.js version this plotly.py release generates figures for
+env.globals['plotlyjs_version'] = get_plotlyjs_version()
+
+# Minimum number of columns before variable analysis is spread over a thread pool
+_PARALLEL_MIN_COLUMNS = 8
+
+# Non-numeric report variable types and the dtype scalar types they cover,
+# matched the same way DataFrame.select_dtypes matches its include list.
+# Python scalar types cover the Arrow-backed dtypes.
+_VARIABLE_TYPES = {
+    'categorical': (np.object_, pd.CategoricalDtype.type),
+    'boolean': (np.bool_, bool),
+    'date': (np.datetime64,),
+    'text': (str,),
+}
 
 class ProfilerError(Exception):
     """Base exception for data profiler errors"""
@@ -27,24 +48,89 @@ class DataSizeError(ProfilerError):
     """Exception raised when data size exceeds limits"""
     pass
 
-def _calculate_overview_stats(df: pd.DataFrame) -> Dict[str, Any]:
+@dataclass
+class FrameStats:
+    """
+    Full-frame scans shared by the report sections.
+    
+    Missing values, duplicate rows and deep memory usage each require a pass
+    over every cell, so they are computed once per profile and reused. Only
+    the reduced results are kept; the cell-level masks are released.
+    """
+    per_col_missing: pd.Series
+    total_missing: int
+    n_dup: int
+    mem_bytes: int
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "FrameStats":
+        """Compute the shared statistics for a DataFrame"""
+        isna_mask = df.isna()
+        per_col_missing = isna_mask.sum(axis=0)
+        dup_mask = df.duplicated()
+        return cls(
+            per_col_missing=per_col_missing,
+            total_missing=int(per_col_missing.sum()),
+            n_dup=int(dup_mask.sum()),
+            mem_bytes=int(df.memory_usage(deep=True).sum())
+        )
+
+def _has_row_major_numeric_block(df: pd.DataFrame) -> bool:
+    """
+    Check whether any multi-column numeric block is not stored column by column
+    
+    pandas keeps each dtype block as a (columns, rows) array, so per-column
+    operations are fastest when that array is C-contiguous. A DataFrame
+    wrapping a C-ordered 2-D NumPy array (or a strided view) is not.
+    """
+    for block in getattr(getattr(df, '_mgr', None), 'blocks', ()):
+        values = getattr(block, 'values', None)
+        if (isinstance(values, np.ndarray) and values.ndim == 2 and values.shape[0] > 1
+                and np.issubdtype(values.dtype, np.number) and not values.flags['C_CONTIGUOUS']):
+            return True
+    return False
+
+def _is_numeric_dtype(dtype: Any) -> bool:
+    """
+    Check whether a dtype is profiled as numeric
+    
+    Covers every real-valued dtype, including nullable (``Int64``) and
+    Arrow-backed (``int64[pyarrow]``) ones, but not booleans.
+    """
+    return (pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            and not pd.api.types.is_complex_dtype(dtype))
+
+def _classify_columns(dtypes: pd.Series) -> pd.Series:
+    """Map each column to its report variable type (None if untyped) in one pass over the dtypes"""
+    def classify(dtype: Any) -> Optional[str]:
+        if _is_numeric_dtype(dtype):
+            return 'numeric'
+        for variable_type, scalar_types in _VARIABLE_TYPES.items():
+            if issubclass(dtype.type, scalar_types):
+                return variable_type
+        return None
+    
+    return pd.Series([classify(dtype) for dtype in dtypes], index=dtypes.index, dtype=object)
+
+def _calculate_overview_stats(df: pd.DataFrame, frame_stats: FrameStats) -> Dict[str, Any]:
     """Calculate overview statistics for the DataFrame"""
     total_cells = df.size
-    missing_cells = df.isna().sum().sum()
-    duplicate_rows = df.duplicated().sum()
+    missing_cells = frame_stats.total_missing
+    duplicate_rows = frame_stats.n_dup
     
     return {
         'rows': len(df),
         'columns': len(df.columns),
-        'memory_usage': f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB",
+        'memory_usage': f"{frame_stats.mem_bytes / 1024**2:.2f} MB",
         'duplicate_rows': duplicate_rows,
         'duplicate_rows_pct': f"{(duplicate_rows / len(df)) * 100:.2f}",
         'missing_cells': missing_cells,
         'missing_cells_pct': f"{(missing_cells / total_cells) * 100:.2f}",
-        'avg_record_size': f"{df.memory_usage(deep=True).sum() / len(df) / 1024:.2f} KB"
+        'avg_record_size': f"{frame_stats.mem_bytes / len(df) / 1024:.2f} KB"
     }
 
-def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = None, return_static: bool = False, output_format: str = 'html') -> Dict[str, Any]:
+def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = None, return_static: bool = False, output_format: str = 'html', describe_row: Optional[pd.Series] = None, value_counts: Optional[pd.Series] = None) -> Dict[str, Any]:
     """
     Analyze a single variable/column
     
@@ -60,6 +146,10 @@ def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = Non
         If True, return static images instead of interactive plots
     output_format : str, default 'html'
         The output format ('html' or 'pdf')
+    describe_row : pandas.Series, optional
+        Precomputed ``describe()`` output for a numeric column
+    value_counts : pandas.Series, optional
+        Precomputed ``value_counts()`` for a categorical column
         
     Returns
     -------
@@ -69,7 +159,7 @@ def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = Non
     series = df[column]
     total_count = len(series)
     missing_count = series.isna().sum()
-    distinct_count = series.nunique()
+    distinct_count = len(value_counts) if value_counts is not None else series.nunique()
     
     var_stats = {
         'name': column,
@@ -81,8 +171,8 @@ def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = Non
     }
     
     # Add numeric statistics if applicable
-    if series.dtype in ['int64', 'float64']:
-        desc = series.describe()
+    if _is_numeric_dtype(series.dtype):
+        desc = describe_row if describe_row is not None else series.describe()
         var_stats.update({
             'mean': f"{desc['mean']:.2f}",
             'std': f"{desc['std']:.2f}",
@@ -94,9 +184,10 @@ def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = Non
         })
         
         # Distribution plot
+        clean = series.dropna()
         fig = go.Figure()
-        fig.add_trace(go.Histogram(x=series.dropna(), name=column))
-        fig.add_trace(go.Box(x=series.dropna(), name=column, yaxis='y2'))
+        fig.add_trace(go.Histogram(x=clean, name=column))
+        fig.add_trace(go.Box(x=clean, name=column, yaxis='y2'))
         fig.update_layout(
             title=f"{column} Distribution",
             yaxis2=dict(overlaying='y', side='right')
@@ -105,22 +196,25 @@ def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = Non
         if return_static:
             var_stats['distribution_plot'] = _convert_to_static_image(fig, format=output_format)
         else:
-            var_stats['distribution_plot'] = fig.to_html(full_html=False, include_plotlyjs='cdn')
+            var_stats['distribution_plot'] = fig.to_html(full_html=False, include_plotlyjs=False)
         
         # Target relationship plot if target exists
         if target and target in df.columns:
-            if df[target].dtype in ['int64', 'float64']:
-                fig = px.scatter(df, x=column, y=target, title=f"{column} vs {target}")
+            # Plot complete pairs only; nullable and Arrow-backed columns hold pd.NA, which Plotly cannot serialize
+            pairs = df[[column, target]].dropna()
+            if _is_numeric_dtype(df[target].dtype):
+                fig = px.scatter(pairs, x=column, y=target, title=f"{column} vs {target}")
             else:
-                fig = px.box(df, x=column, y=target, title=f"{column} by {target}")
+                fig = px.box(pairs, x=column, y=target, title=f"{column} by {target}")
             
             if return_static:
                 var_stats['target_plot'] = _convert_to_static_image(fig, format=output_format)
             else:
-                var_stats['target_plot'] = fig.to_html(full_html=False, include_plotlyjs='cdn')
+                var_stats['target_plot'] = fig.to_html(full_html=False, include_plotlyjs=False)
     else:
         # For categorical variables
-        value_counts = series.value_counts()
+        if value_counts is None:
+            value_counts = series.value_counts()
         var_stats['mode'] = value_counts.index[0] if not value_counts.empty else None
         
         # Distribution plot
@@ -133,20 +227,46 @@ def _analyze_variable(df: pd.DataFrame, column: str, target: Optional[str] = Non
         if return_static:
             var_stats['distribution_plot'] = _convert_to_static_image(fig, format=output_format)
         else:
-            var_stats['distribution_plot'] = fig.to_html(full_html=False, include_plotlyjs='cdn')
+            var_stats['distribution_plot'] = fig.to_html(full_html=False, include_plotlyjs=False)
         
         # Target relationship plot if target exists
-        if target and target in df.columns and df[target].dtype in ['int64', 'float64']:
-            fig = px.box(df, x=column, y=target, title=f"{target} by {column}")
+        if target and target in df.columns and _is_numeric_dtype(df[target].dtype):
+            pairs = df[[column, target]].dropna()
+            fig = px.box(pairs, x=column, y=target, title=f"{target} by {column}")
             
             if return_static:
                 var_stats['target_plot'] = _convert_to_static_image(fig, format=output_format)
             else:
-                var_stats['target_plot'] = fig.to_html(full_html=False, include_plotlyjs='cdn')
+                var_stats['target_plot'] = fig.to_html(full_html=False, include_plotlyjs=False)
     
     return var_stats
 
-def _create_summary_plots(df: pd.DataFrame, target: Optional[str] = None, theme: str = 'light', return_static: bool = False, output_format: str = 'html') -> Dict[str, Any]:
+def _analyze_variables(df: pd.DataFrame, columns: List[str], target: Optional[str] = None, return_static: bool = False, output_format: str = 'html', describe_stats: Optional[pd.DataFrame] = None, value_counts_cache: Optional[Dict[str, pd.Series]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Analyze several variables, in parallel for wide DataFrames
+    
+    The per-column work is independent and spends most of its time in
+    pandas/NumPy code that releases the GIL, so columns are analyzed in a
+    thread pool once there are enough of them to pay for the pool.
+    Results are keyed by column name, in the order of ``columns``.
+    
+    ``describe_stats`` (a frame-level ``describe()``) and
+    ``value_counts_cache`` are looked up per column so that each column is
+    summarized only once per profile.
+    """
+    def analyze(column: str) -> Dict[str, Any]:
+        describe_row = describe_stats[column] if describe_stats is not None and column in describe_stats.columns else None
+        value_counts = value_counts_cache.get(column) if value_counts_cache is not None else None
+        return _analyze_variable(df, column, target, return_static=return_static, output_format=output_format,
+                                 describe_row=describe_row, value_counts=value_counts)
+    
+    if len(columns) <= _PARALLEL_MIN_COLUMNS:
+        return {column: analyze(column) for column in columns}
+    
+    with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as executor:
+        return dict(zip(columns, executor.map(analyze, columns)))
+
+def _create_summary_plots(df: pd.DataFrame, dtype_counts: pd.Series, per_col_missing: pd.Series, corr_matrix: Optional[pd.DataFrame] = None, target: Optional[str] = None, theme: str = 'light', return_static: bool = False, output_format: str = 'html') -> Dict[str, Any]:
     """
     Create summary plots for the DataFrame
     
@@ -154,6 +274,12 @@ def _create_summary_plots(df: pd.DataFrame, target: Optional[str] = None, theme:
     ----------
     df : pandas.DataFrame
         The DataFrame to analyze
+    dtype_counts : pandas.Series
+        Number of columns per dtype
+    per_col_missing : pandas.Series
+        Missing value count per column
+    corr_matrix : pandas.DataFrame, optional
+        Pearson correlation matrix of the numeric columns
     target : str, optional
         Name of the target variable
     theme : str, default 'light'
@@ -173,13 +299,13 @@ def _create_summary_plots(df: pd.DataFrame, target: Optional[str] = None, theme:
     # Types and missing values plot
     fig1 = go.Figure()
     fig1.add_trace(go.Bar(
-        x=df.dtypes.value_counts().index.astype(str),
-        y=df.dtypes.value_counts().values,
+        x=dtype_counts.index.astype(str),
+        y=dtype_counts.values,
         name='Types'
     ))
     fig1.add_trace(go.Bar(
-        x=df.dtypes.value_counts().index.astype(str),
-        y=df.isna().sum().values,
+        x=dtype_counts.index.astype(str),
+        y=per_col_missing.values,
         name='Missing'
     ))
     fig1.update_layout(
@@ -188,9 +314,7 @@ def _create_summary_plots(df: pd.DataFrame, target: Optional[str] = None, theme:
     )
     
     # Correlations plot for numeric columns
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-    if len(numeric_cols) > 1:
-        corr_matrix = df[numeric_cols].corr()
+    if corr_matrix is not None and len(corr_matrix.columns) > 1:
         fig2 = go.Figure(data=go.Heatmap(
             z=corr_matrix.values,
             x=corr_matrix.columns,
@@ -201,28 +325,69 @@ def _create_summary_plots(df: pd.DataFrame, target: Optional[str] = None, theme:
             title='Correlation Matrix',
             template=plotly_template
         )
-        correlations_plot = _convert_to_static_image(fig2, format=output_format) if return_static else fig2.to_html(full_html=False, include_plotlyjs='cdn')
+        correlations_plot = _convert_to_static_image(fig2, format=output_format) if return_static else fig2.to_html(full_html=False, include_plotlyjs=False)
     else:
         correlations_plot = None
     
     return {
-        'types_missing': _convert_to_static_image(fig1, format=output_format) if return_static else fig1.to_html(full_html=False, include_plotlyjs='cdn'),
+        'types_missing': _convert_to_static_image(fig1, format=output_format) if return_static else fig1.to_html(full_html=False, include_plotlyjs=False),
         'correlations': correlations_plot
     }
 
-def _analyze_duplicates(df: pd.DataFrame) -> List[Dict[str, Any]]:
-    """Analyze duplicate rows in the DataFrame"""
-    if df.duplicated().sum() == 0:
+def _analyze_duplicates(df: pd.DataFrame, n_dup: int) -> List[Dict[str, Any]]:
+    """Analyze duplicate rows in the DataFrame, given its duplicate row count"""
+    if n_dup == 0:
         return []
     
-    dup_counts = df.groupby(list(df.columns)).size()
-    dup_counts = dup_counts[dup_counts > 1].sort_values(ascending=False)
+    dup_mask = df.duplicated(keep=False)
+    
+    # Group only the duplicated subset; each pattern maps to its row positions
+    dups = df.loc[dup_mask]
+    pattern_rows = dups.groupby(list(dups.columns), dropna=False, sort=False, observed=True).indices
+    top_patterns = sorted(pattern_rows.values(), key=len, reverse=True)[:10]  # Show top 10 duplicate patterns
     
     return [
-        {'count': count, 'rows': ', '.join(map(str, df[df.duplicated(keep=False)].index[:5]))}
-        for count in dup_counts[:10]  # Show top 10 duplicate patterns
+        {'count': len(positions), 'rows': ', '.join(map(str, dups.index[positions[:5]]))}
+        for positions in top_patterns
     ]
 
+def _as_categorical(series: pd.Series) -> pd.Series:
+    """Cast an object column to categorical, leaving other dtypes unchanged"""
+    return series.astype('category') if series.dtype == object else series
+
+def _value_counts_to_dict(value_counts: pd.Series) -> Dict[str, int]:
+    """Convert value counts to a ``{str(value): int(count)}`` dict with bulk casts"""
+    return dict(zip(value_counts.index.astype(object).astype(str).tolist(), value_counts.to_numpy().astype(int).tolist()))
+
+def _shared_histograms(values1: np.ndarray, values2: np.ndarray, n_bins: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Histogram two arrays of non-missing values over the same bin edges
+    
+    Equivalent to ``np.histogram`` with shared ``np.linspace`` edges (last
+    bin closed), but each array is binned with one ``searchsorted`` over
+    the interior edges and one ``bincount``.
+    """
+    min_val = min(values1.min(), values2.min())
+    max_val = max(values1.max(), values2.max())
+    bins = np.linspace(min_val, max_val, n_bins + 1)
+    
+    inner_edges = bins[1:-1]
+    hist1 = np.bincount(np.searchsorted(inner_edges, values1, side='right'), minlength=n_bins)
+    hist2 = np.bincount(np.searchsorted(inner_edges, values2, side='right'), minlength=n_bins)
+    return bins, hist1, hist2
+
+def _kde_points(values: np.ndarray, n_points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate a Gaussian KDE of non-missing values on an evenly spaced grid
+    
+    Uses the same bandwidth (Scott's rule) and grid as ``Series.plot.kde``:
+    the sample range padded by half its width on each side.
+    """
+    min_val, max_val = values.min(), values.max()
+    sample_range = max_val - min_val
+    xs = np.linspace(min_val - 0.5 * sample_range, max_val + 0.5 * sample_range, n_points)
+    return xs, gaussian_kde(values)(xs)
+
 def profile(
     df: pd.DataFrame,
     target: Optional[str] = None,
@@ -258,6 +423,13 @@ def profile(
         If output_file is None: returns the report content as string
         If return_context is True: returns the context dictionary
         If output_file is provided: returns the output file path
+        
+    Notes
+    -----
+    DataFrames whose numeric data is laid out row by row (for example one
+    built directly from a C-ordered 2-D NumPy array) are copied once before
+    profiling, so that the column-wise statistics scan contiguous memory.
+    The caller's DataFrame is never modified.
     """
     # Check data size limits
     if len(df) > 1_000_000:
@@ -265,18 +437,39 @@ def profile(
     if len(df.columns) > 1000:
         raise DataSizeError("DataFrame exceeds 1000 columns limit")
     
+    # Realign row-major numeric blocks to column-major before the heavy scans
+    if _has_row_major_numeric_block(df):
+        df = df.copy()
+    
     # Determine if we need static images for PDF output
     is_pdf_output = output_format == 'pdf' or output_file and output_file.lower().endswith('.pdf')
     
     # Calculate all statistics and generate plots
-    overview = _calculate_overview_stats(df)
-    variables_list = [_analyze_variable(df, col, target, return_static=is_pdf_output, output_format=output_format) for col in df.columns if col != target]
-    # Convert variables list to dictionary with column names as keys
-    variables = {var['name']: var for var in variables_list}
+    frame_stats = FrameStats.from_frame(df)
+    overview = _calculate_overview_stats(df, frame_stats)
+    
+    # Classify the columns once by dtype
+    column_types = _classify_columns(df.dtypes)
+    type_counts = column_types.value_counts()
+    numeric_cols = df.columns[(column_types == 'numeric').to_numpy()]
+    
+    # Summarize every column once; the per-variable analysis and the
+    # describe() section of the report share these results
+    describe_num = df[numeric_cols].describe() if len(numeric_cols) > 0 else None
+    value_counts_cache = {
+        col: df[col].value_counts()
+        for col, variable_type in column_types.items()
+        if variable_type != 'numeric'
+    }
+    
+    columns = [col for col in df.columns if col != target]
+    variables = _analyze_variables(df, columns, target, return_static=is_pdf_output, output_format=output_format,
+                                   describe_stats=describe_num, value_counts_cache=value_counts_cache)
     
     # Generate plots with appropriate format
-    plots = _create_summary_plots(df, target, theme, return_static=is_pdf_output, output_format=output_format)
-    duplicates = _analyze_duplicates(df)
+    corr_matrix = df[numeric_cols].corr() if len(numeric_cols) > 1 else None
+    plots = _create_summary_plots(df, df.dtypes.value_counts(), frame_stats.per_col_missing, corr_matrix, target, theme, return_static=is_pdf_output, output_format=output_format)
+    duplicates = _analyze_duplicates(df, frame_stats.n_dup)
     
     # Generate DataFrame summary data
     info_buffer = StringIO()
@@ -284,21 +477,15 @@ def profile(
     info_str = info_buffer.getvalue()
     
     # Generate split describe outputs
-    describe_num = df.describe(include=[np.number])
-    describe_num_str = describe_num.to_string() if not describe_num.empty else None
-    
-    describe_obj = df.describe(include=['object', 'category', 'bool'])
-    describe_obj_str = describe_obj.to_string() if not describe_obj.empty else None
+    describe_num_str = describe_num.to_string() if describe_num is not None and not describe_num.empty else None
     
-    head_html = df.head(5).to_html(
-        classes='table table-striped',
-        float_format=lambda x: f'{x:.2f}' if isinstance(x, float) else x
-    )
+    object_cols = df.columns[column_types.isin(['categorical', 'boolean']).to_numpy()]
+    describe_obj_str = df[object_cols].describe(include='all').to_string() if len(object_cols) > 0 else None
     
-    tail_html = df.tail(5).to_html(
-        classes='table table-striped',
-        float_format=lambda x: f'{x:.2f}' if isinstance(x, float) else x
-    )
+    # Float columns are formatted in bulk through the display option
+    with pd.option_context('display.float_format', '{:.2f}'.format):
+        head_html = df.head(5).to_html(classes='table table-striped')
+        tail_html = df.tail(5).to_html(classes='table table-striped')
     
     # Add DataFrame summary data to context
     dataframe_summary_data = {
@@ -313,7 +500,8 @@ def profile(
     # Target variable analysis if specified
     target_analysis = None
     if target and target in df.columns:
-        target_analysis = _analyze_variable(df, target, return_static=is_pdf_output, output_format=output_format)
+        target_analysis = _analyze_variables(df, [target], return_static=is_pdf_output, output_format=output_format,
+                                             describe_stats=describe_num, value_counts_cache=value_counts_cache)[target]
         if target_analysis.get('distribution_plot'):
             # The distribution_plot is already in the correct format (HTML string or base64)
             target_analysis['plot'] = target_analysis['distribution_plot']
@@ -332,15 +520,15 @@ def profile(
         # Flatten overview stats into the root context
         'n_vars': len(df.columns),
         'n_obs': len(df),
-        'n_missing': df.isna().sum().sum(),
-        'missing_percent': (df.isna().sum().sum() / (len(df) * len(df.columns)) * 100).round(2),
-        'n_duplicates': df.duplicated().sum(),
-        'duplicates_percent': (df.duplicated().sum() / len(df) * 100).round(2),
-        'n_numeric': len(df.select_dtypes(include=['int64', 'float64']).columns),
-        'n_categorical': len(df.select_dtypes(include=['object', 'category']).columns),
-        'n_boolean': len(df.select_dtypes(include=['bool']).columns),
-        'n_date': len(df.select_dtypes(include=['datetime64']).columns),
-        'n_text': len(df.select_dtypes(include=['string']).columns),
+        'n_missing': frame_stats.total_missing,
+        'missing_percent': round(frame_stats.total_missing / (len(df) * len(df.columns)) * 100, 2),
+        'n_duplicates': frame_stats.n_dup,
+        'duplicates_percent': round(frame_stats.n_dup / len(df) * 100, 2),
+        'n_numeric': int(type_counts.get('numeric', 0)),
+        'n_categorical': int(type_counts.get('categorical', 0)),
+        'n_boolean': int(type_counts.get('boolean', 0)),
+        'n_date': int(type_counts.get('date', 0)),
+        'n_text': int(type_counts.get('text', 0)),
         # Add overview stats
         'overview': overview,
         # Process variables to match template expectations
@@ -379,25 +567,27 @@ def profile(
     # Return context if requested (for testing)
     if return_context:
         return context
-        
-    html_report = template.render(**context)
     
     # If no output file is specified, return the HTML for display in notebooks
     if not output_file:
-        return html_report
+        return template.render(**context)
     
-    # Save the report
+    # Save the report, streaming the rendered template to disk instead of
+    # first building the full HTML (with any embedded images) as one string
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     if output_format == 'html' or output_path.suffix.lower() == '.html':
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_report)
+        template.stream(**context).dump(str(output_path), encoding='utf-8')
     else:  # pdf
         pdf_path = output_path.with_suffix('.pdf')
-        result_file = open(pdf_path, "w+b")
-        pisa_status = pisa.CreatePDF(html_report, dest=result_file)
-        result_file.close()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            html_path = Path(tmp_dir) / 'report.html'
+            template.stream(**context).dump(str(html_path), encoding='utf-8')
+            # xhtml2pdf still parses the whole document into a DOM; the file is
+            # decoded through the <meta charset="UTF-8"> in base_template.html.j2
+            with open(html_path, 'rb') as html_file, open(pdf_path, 'w+b') as result_file:
+                pisa_status = pisa.CreatePDF(html_file, dest=result_file)
         
         if pisa_status.err:
             raise ProfilerError("Error generating PDF report")
@@ -459,8 +649,10 @@ def compare(
     variable_comparison = {}
     plots = {}
     for col in common_columns:
-        series1 = df1[col]
-        series2 = df2[col]
+        # Object columns are counted several times below (missing, unique,
+        # value counts); as categoricals each count runs on integer codes
+        series1 = _as_categorical(df1[col])
+        series2 = _as_categorical(df2[col])
         
         # Common statistics for all types
         total_count1 = len(series1)
@@ -485,7 +677,7 @@ def compare(
         }
         
         # Type-specific statistics and distribution data
-        if str(series1.dtype) in ['int64', 'float64'] and str(series2.dtype) in ['int64', 'float64']:
+        if _is_numeric_dtype(series1.dtype) and _is_numeric_dtype(series2.dtype):
             # Numeric statistics
             desc1 = series1.describe()
             desc2 = series2.describe()
@@ -500,23 +692,17 @@ def compare(
                 'max': {'df1': f"{desc1['max']:.2f}", 'df2': f"{desc2['max']:.2f}"}
             })
             
+            # Non-missing values, shared by the histogram and KDE
+            values1 = series1.dropna().to_numpy(dtype=float)
+            values2 = series2.dropna().to_numpy(dtype=float)
+            
             # Calculate histogram data
             # Use the same bins for both series to make them comparable
-            min_val = min(series1.min(), series2.min())
-            max_val = max(series1.max(), series2.max())
-            bins = np.linspace(min_val, max_val, n_bins + 1)
-            
-            hist1, _ = np.histogram(series1.dropna(), bins=bins)
-            hist2, _ = np.histogram(series2.dropna(), bins=bins)
+            bins, hist1, hist2 = _shared_histograms(values1, values2, n_bins)
             
             # Calculate KDE points
-            kde1 = series1.dropna().plot.kde(ind=100)
-            x1, y1 = kde1.get_lines()[0].get_data()
-            kde1.clear()
-            
-            kde2 = series2.dropna().plot.kde(ind=100)
-            x2, y2 = kde2.get_lines()[0].get_data()
-            kde2.clear()
+            x1, y1 = _kde_points(values1)
+            x2, y2 = _kde_points(values2)
             
             distribution_data = {
                 'type': 'numeric',
@@ -550,8 +736,8 @@ def compare(
             distribution_data = {
                 'type': 'categorical',
                 'value_counts': {
-                    'df1': {str(k): int(v) for k, v in value_counts1.items()},
-                    'df2': {str(k): int(v) for k, v in value_counts2.items()}
+                    'df1': _value_counts_to_dict(value_counts1),
+                    'df2': _value_counts_to_dict(value_counts2)
                 }
             }
         
@@ -6,8 +6,17 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.io as pio
 import base64
+import hashlib
+from collections import OrderedDict
 from io import BytesIO
 
+# Rendered data URIs keyed on (SHA-1 of the figure JSON, format). Kaleido exports
+# cost far more than serializing a figure and reports often contain identical
+# figures (e.g. low-cardinality bar charts), so each one is only rendered once.
+# Only the digest is kept, never the JSON itself, and the oldest entry is evicted.
+_STATIC_IMAGE_CACHE: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_STATIC_IMAGE_CACHE_SIZE = 64
+
 # Note: Due to a known issue with Kaleido version >= 0.2.1 where PDF export hangs indefinitely,
 # plots are intentionally omitted during PDF export. This issue was introduced between pytics
 # versions 1.1.3 and 1.1.4 when the explicit dependency on kaleido>=0.2.1 was added.
@@ -33,9 +42,19 @@ def _convert_to_static_image(fig: go.Figure, format: str = 'png') -> str:
     """
     if format == 'pdf':
         return "PLOT_OMITTED_FOR_PDF"
+    
+    key = (hashlib.sha1(fig.to_json().encode('utf-8')).hexdigest(), format)
+    if key in _STATIC_IMAGE_CACHE:
+        _STATIC_IMAGE_CACHE.move_to_end(key)
+        return _STATIC_IMAGE_CACHE[key]
+    
     img_bytes = pio.to_image(fig, format=format, engine='kaleido')
     base64_image = base64.b64encode(img_bytes).decode('utf-8')
-    return f"data:image/{format};base64,{base64_image}"
+    data_uri = f"data:image/{format};base64,{base64_image}"
+    _STATIC_IMAGE_CACHE[key] = data_uri
+    if len(_STATIC_IMAGE_CACHE) > _STATIC_IMAGE_CACHE_SIZE:
+        _STATIC_IMAGE_CACHE.popitem(last=False)
+    return data_uri
 
 def create_distribution_comparison_plot(
     distribution_data: Dict[str, Any],
@@ -128,7 +147,7 @@ def create_distribution_comparison_plot(
         if return_static:
             return _convert_to_static_image(fig)
         else:
-            return fig.to_html(full_html=False, include_plotlyjs='cdn'), fig
+            return fig.to_html(full_html=False, include_plotlyjs=False), fig
     else:
         # For categorical data
         # Get all unique categories from both DataFrames
@@ -174,4 +193,4 @@ def create_distribution_comparison_plot(
         if return_static:
             return _convert_to_static_image(fig)
         else:
-            return fig.to_html(full_html=False, include_plotlyjs='cdn'), fig 
\ No newline at end of file
+            return fig.to_html(full_html=False, include_plotlyjs=False), fig 
\ No newline at end of file
@@ -8,6 +8,7 @@ from pytics import profile
 from pytics.profiler import DataSizeError, ProfilerError, compare
 from pathlib import Path
 from jinja2 import Environment, PackageLoader
+from plotly.offline import get_plotlyjs_version
 import builtins
 
 @pytest.fixture
@@ -316,7 +317,7 @@ def test_compare_report_generation(tmp_path):
     assert "categorical" in content
     assert "only_df1" in content
     assert "only_df2" in content
-    assert "plotly-latest.min.js" in content  # Check for Plotly script inclusion
+    assert f"plotly-{get_plotlyjs_version()}.min.js" in content  # Check for Plotly script inclusion
     assert "plotly-graph-div" in content  # Check for plot container
 
 def test_compare_report_themes(tmp_path):
@@ -404,4 +405,135 @@ def test_compare_report_context(sample_df):
     
     # Verify DataFrame references
     assert results['df1'] is sample_df
-    assert results['df2'] is df2 
\ No newline at end of file
+    assert results['df2'] is df2
+
+def test_profile_missing_and_duplicate_counts(sample_df):
+    """Test that overview counts match the underlying DataFrame"""
+    df = pd.concat([sample_df, sample_df.head(3)], ignore_index=True)
+    context = profile(df, return_context=True)
+    
+    assert context['n_missing'] == df.isna().sum().sum()
+    assert context['n_duplicates'] == df.duplicated().sum()
+    assert context['overview']['missing_cells'] == df.isna().sum().sum()
+    assert context['overview']['duplicate_rows'] == 3
+    assert context['overview']['memory_usage'] == f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB"
+
+def test_duplicate_patterns():
+    """Test that each duplicate pattern reports its own rows"""
+    df = pd.DataFrame({
+        'a': [2, 1, 1, 2, 3, np.nan, np.nan, 2],
+        'b': ['y', 'x', 'x', 'y', 'z', None, None, 'y']
+    })
+    context = profile(df, return_context=True)
+    
+    assert context['duplicates'] == [
+        {'count': 3, 'rows': '0, 3, 7'},
+        {'count': 2, 'rows': '1, 2'},
+        {'count': 2, 'rows': '5, 6'}
+    ]
+    assert profile(df.drop_duplicates(), return_context=True)['duplicates'] == []
+
+def test_profile_wide_dataframe():
+    """Test that wide DataFrames keep column order when analyzed in parallel"""
+    np.random.seed(0)
+    df = pd.DataFrame({f'col_{i}': np.random.random(50) for i in range(12)})
+    df['label'] = np.random.choice(['a', 'b'], 50)
+    
+    context = profile(df, target='col_0', return_context=True)
+    
+    assert list(context['variables']) == [col for col in df.columns if col != 'col_0']
+    assert context['variables']['col_5']['mean'] == f"{df['col_5'].mean():.2f}"
+
+def test_compare_histograms_match_numpy():
+    """Test that shared-bin histograms match np.histogram"""
+    np.random.seed(1)
+    df1 = pd.DataFrame({'numeric': np.append(np.random.normal(0, 1, 200), [np.nan, 3.0])})
+    df2 = pd.DataFrame({'numeric': np.random.randint(-3, 4, 150).astype(float)})
+    
+    result = compare(df1, df2, n_bins=12)
+    hist = result['variable_comparison']['numeric']['distribution_data']['histogram']
+    
+    bins = np.array(hist['bins'])
+    expected1, _ = np.histogram(df1['numeric'].dropna(), bins=bins)
+    expected2, _ = np.histogram(df2['numeric'], bins=bins)
+    assert hist['df1_counts'] == expected1.tolist()
+    assert hist['df2_counts'] == expected2.tolist()
+
+def test_row_major_numeric_block():
+    """Test detection of DataFrames backed by a row-major 2-D array"""
+    from pytics.profiler import _has_row_major_numeric_block
+    
+    df = pd.DataFrame(np.random.random((50, 4)), columns=list('abcd'))
+    assert _has_row_major_numeric_block(df)
+    assert not _has_row_major_numeric_block(df.copy())
+    
+    df['label'] = np.random.choice(['x', 'y'], 50)
+    context = profile(df, return_context=True)
+    assert context['variables']['a']['mean'] == f"{df['a'].mean():.2f}"
+
+def test_static_image_cache(monkeypatch):
+    """Test that identical figures are only rendered once"""
+    import plotly.graph_objects as go
+    from pytics import visualizations
+    
+    calls = []
+    def fake_to_image(fig, format, engine):
+        calls.append(format)
+        return b'image'
+    
+    monkeypatch.setattr(visualizations.pio, 'to_image', fake_to_image)
+    visualizations._STATIC_IMAGE_CACHE.clear()
+    
+    fig = go.Figure(go.Bar(x=['a', 'b'], y=[1, 2]))
+    first = visualizations._convert_to_static_image(fig, format='png')
+    second = visualizations._convert_to_static_image(go.Figure(go.Bar(x=['a', 'b'], y=[1, 2])), format='png')
+    
+    assert first == second == "data:image/png;base64,aW1hZ2U="
+    assert calls == ['png']
+    assert visualizations._convert_to_static_image(fig, format='pdf') == 'PLOT_OMITTED_FOR_PDF'
+    visualizations._STATIC_IMAGE_CACHE.clear()
+
+def test_plotlyjs_included_once(sample_df, tmp_path):
+    """Test that the Plotly library is loaded once per report, not per plot"""
+    output_file = tmp_path / "report.html"
+    profile(sample_df, output_file=str(output_file))
+    
+    content = output_file.read_text(encoding='utf-8')
+    assert content.count('<script src="https://cdn.plot.ly/') == 1
+    assert f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js">' in content
+    assert "plotly-graph-div" in content
+
+def test_profile_variable_type_counts():
+    """Test variable type counts and single-kind DataFrames"""
+    df = pd.DataFrame({
+        'int': [1, 2, 3],
+        'float': [1.0, 2.5, np.nan],
+        'cat': pd.Categorical(['a', 'b', 'a']),
+        'flag': [True, False, True],
+        'date': pd.to_datetime(['2020-01-01', '2020-06-01', '2021-01-01'])
+    })
+    context = profile(df, return_context=True)
+    
+    assert (context['n_numeric'], context['n_categorical'], context['n_boolean'], context['n_date']) == (2, 1, 1, 1)
+    
+    numeric_only = profile(df[['int', 'float']], return_context=True)
+    assert numeric_only['dataframe_summary_data']['describe_obj_str'] is None
+    
+    text_only = profile(df[['cat']], return_context=True)
+    assert text_only['dataframe_summary_data']['describe_num_str'] is None
+
+def test_profile_extension_numeric_dtypes():
+    """Test that nullable and 32-bit numeric columns are profiled as numeric"""
+    df = pd.DataFrame({
+        'small_int': np.arange(20, dtype='int32'),
+        'nullable': pd.array([1, None] * 10, dtype='Int64'),
+        'single': np.linspace(0, 1, 20, dtype='float32'),
+        'flag': [True, False] * 10,
+        'label': ['a', 'b', 'c', 'd'] * 5
+    })
+    context = profile(df, target='single', return_context=True)
+    
+    assert context['n_numeric'] == 3
+    assert context['variables']['small_int']['mean'] == '9.50'
+    assert context['variables']['nullable']['mean'] == '1.00'
+    assert context['variables']['flag']['mean'] == ''